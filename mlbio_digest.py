@@ -6,13 +6,40 @@ Fetch ML↔biology papers from the last 30 days:
 - Top 2 arXiv ML/biology preprints (by Altmetric when available, else recency)
 Post a 7-item digest to Slack via Incoming Webhook.
 """
-import os, sys, time, json, math, re
+import os, sys, io, time, json, math, re, html, atexit, argparse, hashlib, heapq, threading
 import datetime as dt
-from typing import List, Dict, Any, Optional
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Dict, Any, Optional, Sequence
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # optional: single-pass multi-keyword matching
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+try:  # optional: faster JSON decode/encode
+    import orjson
+except ImportError:
+    orjson = None
+try:  # optional: C-backed HTML/JATS stripping for abstracts
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
 
 DAY = 86400
-TOP_VENUES = [
+# Altmetric lookups are tiny independent GETs; run them all at once so the
+# enrichment step costs roughly one round-trip instead of ceil(N/workers).
+FANOUT_WORKERS = 16
+# Crossref "etiquette": a contact address routes requests to the polite pool
+CROSSREF_MAILTO = os.environ.get("CROSSREF_MAILTO", "you@example.com")
+POLITE_HEADERS = {
+    "User-Agent": f"mlbio-digest/1.0 (+https://github.com/olgalud/MLbio_digest_runner; mailto:{CROSSREF_MAILTO})",
+    "Accept": "application/json",
+}
+# membership-tested per item in score_item, so a frozenset
+TOP_VENUES = frozenset([
     # --- Core Nature/Cell family ---
     "Nature","Nature Medicine","Nature Biotechnology","Nature Methods","Nature Genetics",
     "Nature Chemical Biology","Nature Machine Intelligence","Nature Communications",
@@ -25,7 +52,11 @@ TOP_VENUES = [
     "Clinical Cancer Research","JCO Precision Oncology","Nature Reviews Drug Discovery",
     "npj Precision Oncology","npj Systems Biology and Applications",
     "Frontiers in Immunology","Frontiers in Oncology"
-]
+])
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SENT_RE = re.compile(r"(?<=[.!?])\s+")
+_WS_RE = re.compile(r"\s+")
 
 def iso_date(d: dt.date) -> str:
     return d.strftime("%Y-%m-%d")
@@ -35,55 +66,137 @@ def last_30_window():
     since = today - dt.timedelta(days=30)
     return iso_date(since), iso_date(today)
 
-def fetch_json(url: str, headers=None, tries=3, timeout=25) -> Any:
-    last = None
-    for i in range(tries):
-        try:
-            r = requests.get(url, headers=headers or {"Accept":"application/json"}, timeout=timeout)
-            if r.status_code == 200:
-                return r.json()
-            last = f"HTTP {r.status_code}"
-        except Exception as e:
-            last = str(e)
-        time.sleep(1.2 * (i+1))
-    raise RuntimeError(f"Failed GET {url}: {last}")
-
-def fetch_text(url: str, tries=3, timeout=25) -> str:
-    last = None
-    for i in range(tries):
-        try:
-            r = requests.get(url, timeout=timeout)
-            if r.status_code == 200:
-                return r.text
-            last = f"HTTP {r.status_code}"
-        except Exception as e:
-            last = str(e)
-        time.sleep(1.2 * (i+1))
-    raise RuntimeError(f"Failed GET {url}: {last}")
-
-def altmetric_by_doi(doi: str) -> Dict[str, Any]:
-    url = f"https://api.altmetric.com/v1/doi/{requests.utils.quote(doi, safe='')}"
+class NotFound(RuntimeError):
+    """GET returned 404; retrying will not help."""
+
+# Longest we will sleep on a Retry-After. urllib3 otherwise sleeps for whatever
+# the server asks; Altmetric is best-effort, so one long 429 must not stall the run.
+RETRY_AFTER_MAX = 5.0
+
+class CappedRetry(Retry):
+    """Retry that honours Retry-After but never waits longer than RETRY_AFTER_MAX."""
+    def get_retry_after(self, response):
+        after = super().get_retry_after(response)
+        return None if after is None else min(after, RETRY_AFTER_MAX)
+
+# One pooled keep-alive session for every GET: the TLS handshake to each host is
+# paid once per run, and urllib3 handles backoff (honouring a capped Retry-After).
+_SESSION = requests.Session()
+# session defaults; per-call headers are merged over these (and over requests'
+# own Accept-Encoding, which negotiates every decoder installed)
+_SESSION.headers.update(POLITE_HEADERS)
+_ADAPTER = HTTPAdapter(
+    pool_connections=16, pool_maxsize=32,
+    max_retries=CappedRetry(
+        total=3, backoff_factor=1.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,  # wait out short Altmetric/Crossref 429s
+        raise_on_status=False,            # hand the final response to _get
+    ),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+def _get(url: str, headers=None, timeout=25) -> requests.Response:
+    r = _SESSION.get(url, headers=headers, timeout=timeout)
+    if r.status_code == 404:
+        raise NotFound(f"Failed GET {url}: HTTP 404")
+    if r.status_code != 200:
+        raise RuntimeError(f"Failed GET {url}: HTTP {r.status_code}")
+    return r
+
+def fetch_json(url: str, headers=None, timeout=25) -> Any:
+    r = _get(url, headers=headers, timeout=timeout)
+    return orjson.loads(r.content) if orjson else r.json()
+
+def fetch_bytes(url: str, timeout=25) -> bytes:
+    return _get(url, headers={"Accept": "application/atom+xml"}, timeout=timeout).content
+
+class AltmetricCache:
+    """
+    Small JSON file cache of Altmetric lookups, keyed "doi:<doi>" / "arxiv:<id>".
+    Entries are {"value": {...}, "fetched_at": epoch}; an empty value records a 404
+    so missing DOIs are not re-probed. Disabled when path is empty.
+    """
+    def __init__(self, path: str, ttl: int = DAY):
+        self.path = os.path.expanduser(path) if path else ""
+        self.ttl = ttl
+        self.data: Dict[str, Dict[str, Any]] = {}
+        self.dirty = False
+        self.lock = threading.Lock()
+        if self.path and os.path.exists(self.path):
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self.data = json.load(f)
+            except Exception as e:
+                print(f"[Altmetric] Ignoring unreadable cache {self.path}: {e}")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.path:
+            return None
+        hit = self.data.get(key)
+        if hit and time.time() - hit.get("fetched_at", 0) < self.ttl:
+            return hit["value"]
+        return None
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        if not self.path:
+            return
+        with self.lock:
+            self.data[key] = {"value": value, "fetched_at": time.time()}
+            self.dirty = True
+
+    def save(self) -> None:
+        if not (self.path and self.dirty):
+            return
+        now = time.time()
+        with self.lock:
+            fresh = {k: v for k, v in self.data.items() if now - v.get("fetched_at", 0) < self.ttl}
+        d = os.path.dirname(self.path)
+        if d:
+            os.makedirs(d, exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(fresh, f)
+        os.replace(tmp, self.path)
+
+ALTMETRIC_CACHE = AltmetricCache(os.environ.get("ALTMETRIC_CACHE_PATH", ""))
+atexit.register(ALTMETRIC_CACHE.save)
+
+def altmetric_lookup(kind: str, ident: str) -> Dict[str, Any]:
+    key = f"{kind}:{ident}"
+    cached = ALTMETRIC_CACHE.get(key)
+    if cached is not None:
+        return cached
+    url = f"https://api.altmetric.com/v1/{kind}/{requests.utils.quote(ident, safe='')}"
     try:
         j = fetch_json(url)
-        return {
-            "tweets": j.get("cited_by_tweeters_count"),
-            "altmetric_score": j.get("score"),
-            "altmetric_url": j.get("details_url"),
-        }
+    except NotFound:
+        ALTMETRIC_CACHE.put(key, {})
+        return {}
     except Exception:
         return {}
+    out = {
+        "tweets": j.get("cited_by_tweeters_count"),
+        "altmetric_score": j.get("score"),
+        "altmetric_url": j.get("details_url"),
+    }
+    ALTMETRIC_CACHE.put(key, out)
+    return out
+
+def altmetric_by_doi(doi: str) -> Dict[str, Any]:
+    return altmetric_lookup("doi", doi)
 
 def altmetric_by_arxiv(arxivid: str) -> Dict[str, Any]:
-    url = f"https://api.altmetric.com/v1/arxiv/{requests.utils.quote(arxivid, safe='')}"
-    try:
-        j = fetch_json(url)
-        return {
-            "tweets": j.get("cited_by_tweeters_count"),
-            "altmetric_score": j.get("score"),
-            "altmetric_url": j.get("details_url"),
-        }
-    except Exception:
-        return {}
+    return altmetric_lookup("arxiv", arxivid)
+
+def fan_out(fn: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+    # run fn over items concurrently (I/O-bound), preserving input order
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=min(FANOUT_WORKERS, len(items))) as ex:
+        return list(ex.map(fn, items))
 
 def score_item(it: Dict[str,Any]) -> float:
     venue_bonus = 10.0 if (it.get("journal") in TOP_VENUES or it.get("source") in TOP_VENUES) else 0.0
@@ -94,149 +207,263 @@ def score_item(it: Dict[str,Any]) -> float:
 def first_two_sentences(text: str) -> str:
     if not text:
         return ""
-    # naive split on sentence enders; keep up to two
-    parts = re.split(r'(?<=[.!?])\s+', text.strip())
+    # naive split on sentence enders; keep up to two (stop scanning after the 2nd)
+    parts = _SENT_RE.split(text.strip(), maxsplit=2)
     if len(parts) >= 2:
         return ' '.join(parts[:2])
     return parts[0]
 
-def fetch_crossref() -> List[Dict[str,Any]]:
-    since, until = last_30_window()
-    # Query per journal with simpler keyword filter to avoid Crossref parser quirks
-    KEYWORDS = [
-        "machine learning", "deep learning", "artificial intelligence", "foundation model",
-        "neural network", "graph learning", "transformer", "representation learning",
-        "immunology", "t cell", "t-cell", "tcr", "neoantigen", "immune checkpoint",
-        "tumor microenvironment", "immunotherapy", "checkpoint blockade",
-        "cancer", "oncology", "tumor", "antigen", "peptide presentation", "hla",
-        "mhc", "tumor-infiltrating lymphocyte", "b cell receptor", "antibody repertoire",
-        "spatial omics", "proteomics", "immunopeptidomics", "cytometry", "cell phenotype"
-    ]
-    EXCLUDE_KEYWORDS = [
-        "embryology", "embryonic development", "morphogenesis", "developmental biology"
-    ]
-    JOURNALS = [
-        "Nature","Nature Medicine","Nature Biotechnology","Nature Methods","Nature Genetics",
-        "Nature Chemical Biology","Nature Machine Intelligence","Nature Communications",
-        "Cell","Cell Reports","Cell Systems","Immunity","Cancer Cell","Molecular Cell",
-        "Cell Genomics","Cell Host & Microbe"
-    ]
-
-    results = []
-    headers = {"Accept":"application/json","User-Agent":"mlbio-digest/1.0 (mailto:you@example.com)"}
+# Crossref results are keyword-filtered locally to avoid Crossref query-parser quirks
+KEYWORDS = (
+    "machine learning", "deep learning", "artificial intelligence", "foundation model",
+    "neural network", "graph learning", "transformer", "representation learning",
+    "immunology", "t cell", "t-cell", "tcr", "neoantigen", "immune checkpoint",
+    "tumor microenvironment", "immunotherapy", "checkpoint blockade",
+    "cancer", "oncology", "tumor", "antigen", "peptide presentation", "hla",
+    "mhc", "tumor-infiltrating lymphocyte", "b cell receptor", "antibody repertoire",
+    "spatial omics", "proteomics", "immunopeptidomics", "cytometry", "cell phenotype"
+)
+EXCLUDE_KEYWORDS = (
+    "embryology", "embryonic development", "morphogenesis", "developmental biology"
+)
+# ordered (not a set) so the Crossref query URL, and its cache key, is stable
+JOURNALS = (
+    "Nature","Nature Medicine","Nature Biotechnology","Nature Methods","Nature Genetics",
+    "Nature Chemical Biology","Nature Machine Intelligence","Nature Communications",
+    "Cell","Cell Reports","Cell Systems","Immunity","Cancer Cell","Molecular Cell",
+    "Cell Genomics","Cell Host & Microbe"
+)
+
+class KeywordMatcher:
+    """
+    Multi-keyword screen over a lowercased haystack. With pyahocorasick installed
+    all keywords are matched in one pass over the text; otherwise falls back to
+    per-keyword substring search (which beats an re alternation in CPython).
+    """
+    def __init__(self, words: Sequence[str]):
+        self.words = tuple(k.lower() for k in words)
+        self.automaton = None
+        if ahocorasick is not None:
+            self.automaton = ahocorasick.Automaton()
+            for k in self.words:
+                self.automaton.add_word(k, k)
+            self.automaton.make_automaton()
+
+    def search(self, hay: str) -> bool:
+        if self.automaton is not None:
+            return next(self.automaton.iter(hay), None) is not None
+        return any(k in hay for k in self.words)
+
+_KEYWORD_MATCHER = KeywordMatcher(KEYWORDS)
+_EXCLUDE_MATCHER = KeywordMatcher(EXCLUDE_KEYWORDS)
+
+CROSSREF_ROWS = 200
+# A month of these 16 journals runs well past 1000 articles; 10 pages of 200
+# covers the full 30-day window (still fewer calls than one query per journal).
+CROSSREF_MAX_ITEMS = 2000
+CROSSREF_TOP = 5
+ENRICH_CAP = 30   # never look up more than this many candidates
+# Raw Crossref results for the current window. Keys embed the UTC window dates,
+# so an entry is only ever hit until midnight UTC; older files are pruned on write.
+CROSSREF_CACHE_DIR = os.path.expanduser("~/.cache/mlbio_digest/crossref")
+
+def _crossref_cache_path(key: str) -> str:
+    return os.path.join(CROSSREF_CACHE_DIR, f"{key}.json")
+
+def _crossref_cache_get(key: str) -> Optional[List[Dict[str,Any]]]:
+    path = _crossref_cache_path(key)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"[Crossref] Ignoring unreadable cache {path}: {e}")
+        return None
 
-    for jname in JOURNALS:
-        # Start with broad date filter; keep rows modest to reduce latency
-        base = ( "https://api.crossref.org/works"
-                 f"?filter=from-pub-date:{since},until-pub-date:{until},type:journal-article,container-title:{requests.utils.quote(jname, safe='')}"
-                 "&select=DOI,title,container-title,author,abstract,URL,created,issued"
-                 "&rows=20" )
-        # Pull once without keywords (fast), then keyword-filter locally
+def _crossref_cache_put(key: str, items: List[Dict[str,Any]]) -> None:
+    try:
+        os.makedirs(CROSSREF_CACHE_DIR, exist_ok=True)
+        for name in os.listdir(CROSSREF_CACHE_DIR):
+            if name.endswith(".json") and name != f"{key}.json":
+                os.remove(os.path.join(CROSSREF_CACHE_DIR, name))
+        path = _crossref_cache_path(key)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(items, f)
+        os.replace(path + ".tmp", path)
+    except OSError as e:
+        print(f"[Crossref] Could not write cache: {e}")
+
+def fetch_crossref_works(since: str, until: str, journals: Sequence[str], use_cache: bool = True) -> List[Dict[str,Any]]:
+    # Crossref ORs repeated filter keys, so all journals fit in one query;
+    # page newest-first with a deep cursor until the window is exhausted.
+    # CROSSREF_MAX_ITEMS is only a safety stop; if it is ever hit, the oldest
+    # works are the ones dropped, and we say so
+    filters = f"from-pub-date:{since},until-pub-date:{until},type:journal-article," + ",".join(
+        f"container-title:{requests.utils.quote(j, safe='')}" for j in journals)
+    base = ( "https://api.crossref.org/works"
+             f"?filter={filters}"
+             "&select=DOI,title,container-title,author,abstract,URL,created,issued"
+             f"&rows={CROSSREF_ROWS}"
+             "&sort=published&order=desc"
+             f"&mailto={requests.utils.quote(CROSSREF_MAILTO, safe='@')}" )
+    key = f"{since}__{until}__{hashlib.sha1(base.encode()).hexdigest()[:12]}"
+    # use_cache=False (--no-cache) means "refresh": skip the read, but a complete
+    # fetch still replaces today's entry so later runs pick up the fresh data
+    if use_cache:
+        cached = _crossref_cache_get(key)
+        if cached is not None:
+            print(f"[Crossref] Using cached results for {since}..{until}")
+            return cached
+    items: List[Dict[str,Any]] = []
+    cursor = "*"
+    complete = True
+    while cursor and len(items) < CROSSREF_MAX_ITEMS:
         try:
-            j = fetch_json(base, headers=headers)
+            j = fetch_json(f"{base}&cursor={requests.utils.quote(cursor, safe='')}")
         except Exception as e:
-            print(f"[Crossref] Skipped {jname}: {e}")
-            continue
-
-        for x in j.get("message", {}).get("items", []):
-            title = ((x.get("title") or [])[:1] or [""])[0]
-            abstr = (x.get("abstract") or "")
-            # quick in-memory keyword match
-            hay = " ".join([title, re.sub(r"<[^>]+>", " ", abstr or "")]).lower()
-            if not any(k in hay for k in [kw.lower() for kw in KEYWORDS]):
-                continue
-            if any(x in hay for x in EXCLUDE_KEYWORDS):
-                continue
-
-            issued = x.get("issued",{}).get("date-parts", [[]])[0]
-            pubdate = "-".join(str(p) for p in issued) if issued else (x.get("created",{}).get("date-time","")[:10])
-            authors = [(" ".join(filter(None, [a.get("given"), a.get("family")]))).strip() for a in (x.get("author") or [])]
-            clean_abs = re.sub(r"<[^>]+>", " ", abstr).strip()
-
-            rec = {
-                "source": "Crossref",
-                "journal": ((x.get("container-title") or [])[:1] or [""])[0],
-                "title": title,
-                "abstract": clean_abs,
-                "authors": authors,
-                "published": pubdate,
-                "url": x.get("URL"),
-                "doi": x.get("DOI")
-            }
-            results.append(rec)
+            print(f"[Crossref] Stopped after {len(items)} items: {e}")
+            complete = False
+            break
+        msg = j.get("message", {})
+        page = msg.get("items", [])
+        if not page:
+            break
+        items.extend(page)
+        cursor = msg.get("next-cursor")
+    if cursor and len(items) >= CROSSREF_MAX_ITEMS:
+        print(f"[Crossref] Hit the {CROSSREF_MAX_ITEMS}-item cap; works older than "
+              f"{items[CROSSREF_MAX_ITEMS - 1].get('issued', {}).get('date-parts', [['?']])[0]} may not have been fetched")
+    items = items[:CROSSREF_MAX_ITEMS]
+    if complete:  # never pin a partial result set for the rest of the day
+        _crossref_cache_put(key, items)
+    return items
 
-    # De-dupe by DOI
-    seen = set()
-    uniq = []
-    for it in results:
-        if it.get("doi") and it["doi"] in seen:
+def canonical_doi(doi: Optional[str]) -> str:
+    doi = (doi or "").strip().lower()
+    for prefix in ("https://doi.org/", "http://doi.org/", "https://dx.doi.org/", "http://dx.doi.org/", "doi:"):
+        if doi.startswith(prefix):
+            return doi[len(prefix):]
+    return doi
+
+def strip_html(s: str) -> str:
+    # Crossref abstracts are often JATS/HTML; plain text passes straight through
+    if "<" not in s:
+        return s
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(s).text(separator=" ")
+    return html.unescape(_TAG_RE.sub(" ", s))
+
+def fetch_crossref(use_cache: bool = True) -> List[Dict[str,Any]]:
+    since, until = last_30_window()
+    # De-dupe in the same pass: newest record per canonical DOI, or per
+    # (title, journal) when the DOI is missing, so near-duplicates never reach Altmetric
+    best: Dict[Any, Dict[str,Any]] = {}
+
+    # One OR-joined container-title query instead of one request per journal,
+    # then keyword-filter locally
+    for x in fetch_crossref_works(since, until, JOURNALS, use_cache=use_cache):
+        title = ((x.get("title") or [])[:1] or [""])[0]
+        abstr = (x.get("abstract") or "")
+        # strip JATS/HTML once and reuse below
+        clean_abs = strip_html(abstr).strip()
+        # quick in-memory keyword match
+        hay = " ".join([title, clean_abs]).lower()
+        if not _KEYWORD_MATCHER.search(hay):
+            continue
+        if _EXCLUDE_MATCHER.search(hay):
             continue
-        if it.get("doi"): seen.add(it["doi"])
-        uniq.append(it)
 
-    # Altmetric enrichment with small parallel fan-out
-    from concurrent.futures import ThreadPoolExecutor, as_completed
+        issued = x.get("issued",{}).get("date-parts", [[]])[0]
+        # zero-pad date-parts so published dates sort as strings
+        pubdate = "-".join(str(p).zfill(2) for p in issued) if issued else (x.get("created",{}).get("date-time","")[:10])
+        authors = [(" ".join(filter(None, [a.get("given"), a.get("family")]))).strip() for a in (x.get("author") or [])]
+
+        rec = {
+            "source": "Crossref",
+            "journal": ((x.get("container-title") or [])[:1] or [""])[0],
+            "title": title,
+            "abstract": clean_abs,
+            "authors": authors,
+            "published": pubdate,
+            "url": x.get("URL"),
+            "doi": canonical_doi(x.get("DOI"))
+        }
+        key = rec["doi"] or (title.lower().strip(), rec["journal"])
+        prev = best.get(key)
+        if prev is None or pubdate > prev["published"]:
+            best[key] = rec
+
+    # Altmetric enrichment for up to ENRICH_CAP candidates, all in flight at once.
+    # Attention accrues as a paper ages, so a newest-first cap would only ever
+    # rank the least-noticed papers; sample the cap evenly across the window.
     def enrich(it):
         if it.get("doi"):
             it.update(altmetric_by_doi(it["doi"]))
         it["rank_score"] = score_item(it)
         return it
 
-    enriched = []
-    with ThreadPoolExecutor(max_workers=5) as ex:
-        futs = [ex.submit(enrich, it) for it in uniq[:30]]  # cap to 30
-        for f in as_completed(futs):
-            enriched.append(f.result())
+    def alt(it):
+        return it.get("altmetric_score") or 0.0
 
-    # Sort by Altmetric score desc, keep top 5
-    enriched.sort(key=lambda r: (r.get("altmetric_score") or 0.0), reverse=True)
-    top5 = enriched[:5]
-    print(f"Crossref candidates: {len(uniq)}, after Altmetric keep: {len(top5)}")
+    ordered = sorted(best.values(), key=lambda r: r.get("published",""), reverse=True)
+    if len(ordered) > ENRICH_CAP:
+        step = len(ordered) / ENRICH_CAP
+        ordered = [ordered[int(i * step)] for i in range(ENRICH_CAP)]
+    enriched = fan_out(enrich, ordered)
+
+    # Top 5 by Altmetric score
+    top5 = heapq.nlargest(CROSSREF_TOP, enriched, key=alt)
+    print(f"Crossref candidates: {len(best)}, enriched: {len(enriched)}, kept: {len(top5)}")
     return top5
 
-def parse_arxiv_xml(xml: str) -> List[Dict[str,Any]]:
-    # minimal parse: not robust XML library to avoid extra deps
-    entries = xml.split("<entry>")[1:]
-    out = []
-    for e in entries:
-        try:
-            def tag(t):
-                m = re.search(fr"<{t}>(.*?)</{t}>", e, flags=re.S)
-                return (m.group(1).strip() if m else "")
-            def taga(t, attr):
-                m = re.search(fr"<{t}[^>]*\s{attr}=['\"]([^'\"]+)['\"][^>]*>", e)
-                return (m.group(1) if m else "")
-            _id = tag("id")
-            title = re.sub(r"\s+", " ", tag("title")).strip()
-            summary = re.sub(r"\s+", " ", tag("summary")).strip()
-            published = tag("published")[:10] or tag("updated")[:10]
-            # extract arxiv id
-            arxiv_id = ""
-            if "/abs/" in _id:
-                arxiv_id = _id.split("/abs/")[1]
-            else:
-                parts = _id.split("/")
-                arxiv_id = parts[-1]
-            # link
-            url = taga("link", "href") or _id
-            # primary category
-            m = re.search(r'<arxiv:primary_category[^>]*term=[\'"]([^\'"]+)[\'"]', e)
-            cat = m.group(1) if m else ""
-            # authors (naive)
-            authors = re.findall(r"<name>(.*?)</name>", e)
-            out.append({
-                "source": "arXiv",
-                "arxiv_id": arxiv_id,
-                "title": title,
-                "abstract": summary,
-                "authors": authors,
-                "published": published,
-                "url": url,
-                "category": cat
-            })
-        except Exception:
-            continue
-    return out
+ATOM = "{http://www.w3.org/2005/Atom}"
+ARXIV = "{http://arxiv.org/schemas/atom}"
+
+def parse_arxiv_xml(data: bytes) -> Iterator[Dict[str,Any]]:
+    # stream the raw Atom bytes through the stdlib C parser and yield one record
+    # per <entry>; finished entries are dropped from the tree as we go, so only
+    # the current entry is ever held in memory
+    n = 0
+    try:
+        ctx = ET.iterparse(io.BytesIO(data), events=("start", "end"))
+        _, root = next(ctx)
+        for ev, e in ctx:
+            if ev != "end" or e.tag != ATOM + "entry":
+                continue
+            try:
+                _id = (e.findtext(ATOM + "id") or "").strip()
+                title = _WS_RE.sub(" ", e.findtext(ATOM + "title") or "").strip()
+                summary = _WS_RE.sub(" ", e.findtext(ATOM + "summary") or "").strip()
+                published = (e.findtext(ATOM + "published") or "")[:10] or (e.findtext(ATOM + "updated") or "")[:10]
+                # extract arxiv id
+                if "/abs/" in _id:
+                    arxiv_id = _id.split("/abs/")[1]
+                else:
+                    arxiv_id = _id.split("/")[-1]
+                link = e.find(ATOM + "link")
+                url = (link.get("href") if link is not None else "") or _id
+                pc = e.find(ARXIV + "primary_category")
+                cat = pc.get("term", "") if pc is not None else ""
+                authors = [(a.findtext(ATOM + "name") or "").strip() for a in e.iterfind(ATOM + "author")]
+                rec = {
+                    "source": "arXiv",
+                    "arxiv_id": arxiv_id,
+                    "title": title,
+                    "abstract": summary,
+                    "authors": authors,
+                    "published": published,
+                    "url": url,
+                    "category": cat
+                }
+            except Exception:
+                continue
+            finally:
+                root.clear()
+            n += 1
+            yield rec
+    except ET.ParseError as err:
+        print(f"[arXiv] Feed truncated after {n} entries: {err}")
 
 def fetch_arxiv_top2() -> List[Dict[str,Any]]:
     since, until = last_30_window()
@@ -250,30 +477,22 @@ def fetch_arxiv_top2() -> List[Dict[str,Any]]:
         'AND NOT (abs:"embryology" OR abs:"developmental biology" OR ti:"embryology")'
     )   
     url = f"https://export.arxiv.org/api/query?search_query={requests.utils.quote(query)}&sortBy=submittedDate&sortOrder=descending&max_results=60"
-    xml = fetch_text(url)
-    items = parse_arxiv_xml(xml)
-
     cutoff = dt.datetime.utcnow().date() - dt.timedelta(days=30)
-    items = [it for it in items if it.get("published") and dt.date.fromisoformat(it["published"]) >= cutoff]
+    items = [it for it in parse_arxiv_xml(fetch_bytes(url))
+             if it.get("published") and dt.date.fromisoformat(it["published"]) >= cutoff]
 
     # Only the 10 most recent get Altmetric calls
-    recent = sorted(items, key=lambda r: r.get("published",""), reverse=True)[:10]
+    recent = heapq.nlargest(10, items, key=lambda r: r.get("published",""))
 
-    from concurrent.futures import ThreadPoolExecutor, as_completed
     def enrich(it):
         if it.get("arxiv_id"):
             it.update(altmetric_by_arxiv(it["arxiv_id"]))
         it["rank_score"] = score_item(it)
         return it
 
-    enriched = []
-    with ThreadPoolExecutor(max_workers=5) as ex:
-        futs = [ex.submit(enrich, it) for it in recent]
-        for f in as_completed(futs):
-            enriched.append(f.result())
+    enriched = fan_out(enrich, recent)
 
-    enriched.sort(key=lambda r: ((r.get("altmetric_score") or 0.0), r.get("published","")), reverse=True)
-    return enriched[:2]
+    return heapq.nlargest(2, enriched, key=lambda r: ((r.get("altmetric_score") or 0.0), r.get("published","")))
 
 
 def format_item(it: Dict[str,Any]) -> Dict[str,str]:
@@ -285,14 +504,16 @@ def format_item(it: Dict[str,Any]) -> Dict[str,str]:
     summary = first_two_sentences(abstract) or "Summary unavailable."
     return {"title": title, "date": date, "url": url, "summary": summary}
 
-def build_digest() -> List[Dict[str,str]]:
-    print("Fetching Crossref (Nature/Cell)…")
-    cross = fetch_crossref()
-    print(f"Crossref done: {len(cross)} items")
-
-    print("Fetching arXiv…")
-    arx = fetch_arxiv_top2()
-    print(f"arXiv done: {len(arx)} items")
+def build_digest(use_cache: bool = True) -> List[Dict[str,str]]:
+    # Crossref and arXiv are independent; fetch (and enrich) them side by side
+    print("Fetching Crossref (Nature/Cell) and arXiv…")
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        cross_f = ex.submit(fetch_crossref, use_cache)
+        arx_f = ex.submit(fetch_arxiv_top2)
+        cross = cross_f.result()
+        print(f"Crossref done: {len(cross)} items")
+        arx = arx_f.result()
+        print(f"arXiv done: {len(arx)} items")
 
     items = [format_item(x) for x in cross] + [format_item(x) for x in arx]
     return items
@@ -303,31 +524,40 @@ def slack_blocks(items: List[Dict[str,str]]) -> Dict[str,Any]:
         "text": {"type":"plain_text","text":"ML ↔ Biology: Last 30 Days (Top 5 + 2 arXiv)","emoji":True}
     }
     divider = {"type":"divider"}
-    sections = []
-    for i, it in enumerate(items, start=1):
-        sections.append({
+    sections = [
+        {
             "type":"section",
             "text": {
                 "type":"mrkdwn",
                 "text": f"*{i}. <{it['url']}|{it['title']}>*\n_{it['date']}_ – {it['summary']}"
             }
-        })
+        }
+        for i, it in enumerate(items, start=1)
+    ]
     return {"blocks": [header, divider, *sections]}
 
 def post_to_slack(webhook_url, payload):
-    import requests
-    r = requests.post(webhook_url, json=payload, timeout=20)
+    if orjson:
+        r = requests.post(webhook_url, data=orjson.dumps(payload),
+                          headers={"Content-Type": "application/json"}, timeout=20)
+    else:
+        r = requests.post(webhook_url, json=payload, timeout=20)
     print(f"Slack status={r.status_code} body={r.text[:200]}")
     r.raise_for_status()
 
 def main():
+    ap = argparse.ArgumentParser(description="Post the ML↔biology digest to Slack.")
+    ap.add_argument("--no-cache", action="store_true",
+                    help="refetch Crossref instead of reading today's cache (the fresh results are still cached)")
+    args = ap.parse_args()
+
     webhook = os.environ.get("SLACK_WEBHOOK_URL")
     if not webhook:
         print("ERROR: SLACK_WEBHOOK_URL environment variable is not set.", file=sys.stderr)
         sys.exit(2)
 
     print("Starting digest…")
-    items = build_digest()
+    items = build_digest(use_cache=not args.no_cache)
     print(f"Built payload with {len(items)} items")
     payload = slack_blocks(items)
     print("Posting to Slack…")
@@ -0,0 +1,287 @@
+import datetime as dt
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("requests")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+import mlbio_digest as md  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _isolated_crossref_cache(tmp_path, monkeypatch):
+    # fetch_crossref_works writes (and prunes) the cache dir; never touch ~/.cache
+    monkeypatch.setattr(md, "CROSSREF_CACHE_DIR", str(tmp_path / "crossref"))
+
+
+def test_altmetric_cache_round_trip_with_home_relative_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    cache = md.AltmetricCache("~/.cache/mlbio_digest/altmetric.json")
+    cache.put("doi:10.1/x", {"tweets": 3, "altmetric_score": 7.5, "altmetric_url": "u"})
+    cache.put("doi:10.1/missing", {})  # negative entry for a 404
+    cache.save()
+    assert (tmp_path / ".cache" / "mlbio_digest" / "altmetric.json").exists()
+
+    reloaded = md.AltmetricCache("~/.cache/mlbio_digest/altmetric.json")
+    assert reloaded.get("doi:10.1/x") == {"tweets": 3, "altmetric_score": 7.5, "altmetric_url": "u"}
+    assert reloaded.get("doi:10.1/missing") == {}
+    assert reloaded.get("doi:10.1/never-seen") is None
+
+
+def test_altmetric_cache_drops_expired_entries(tmp_path):
+    path = str(tmp_path / "alt.json")
+    cache = md.AltmetricCache(path, ttl=60)
+    cache.put("arxiv:2501.00001", {"tweets": 1})
+    cache.data["arxiv:2501.00001"]["fetched_at"] -= 120
+    assert cache.get("arxiv:2501.00001") is None
+
+
+def test_crossref_works_pages_newest_first_and_caps(tmp_path, monkeypatch):
+    urls = []
+
+    def fake_fetch_json(url, headers=None, timeout=25):
+        urls.append(url)
+        page = [{"DOI": f"10.1/{len(urls)}-{i}"} for i in range(md.CROSSREF_ROWS)]
+        return {"message": {"items": page, "next-cursor": f"c{len(urls)}"}}
+
+    monkeypatch.setattr(md, "fetch_json", fake_fetch_json)
+    items = md.fetch_crossref_works("2026-09-15", "2026-10-15", md.JOURNALS, use_cache=False)
+    assert md.CROSSREF_CACHE_DIR.startswith(str(tmp_path))
+
+    assert len(items) == md.CROSSREF_MAX_ITEMS
+    assert len(urls) == md.CROSSREF_MAX_ITEMS // md.CROSSREF_ROWS
+    assert all("&sort=published&order=desc" in u for u in urls)
+    assert "cursor=%2A" in urls[0] and "cursor=c1" in urls[1]
+
+
+def test_crossref_cache_get_put_prunes_other_days():
+    assert md._crossref_cache_get("2026-09-14__2026-10-14__abc") is None
+    md._crossref_cache_put("2026-09-14__2026-10-14__abc", [{"DOI": "10.1/old"}])
+    md._crossref_cache_put("2026-09-15__2026-10-15__abc", [{"DOI": "10.1/new"}])
+
+    assert os.listdir(md.CROSSREF_CACHE_DIR) == ["2026-09-15__2026-10-15__abc.json"]
+    assert md._crossref_cache_get("2026-09-15__2026-10-15__abc") == [{"DOI": "10.1/new"}]
+    assert md._crossref_cache_get("2026-09-14__2026-10-14__abc") is None
+
+
+def _one_page_crossref(calls, items, fail=False):
+    def fake_fetch_json(url, headers=None, timeout=25):
+        calls.append(url)
+        if fail:
+            raise RuntimeError("HTTP 503")
+        return {"message": {"items": items if len(calls) == 1 else [], "next-cursor": "c"}}
+    return fake_fetch_json
+
+
+def test_crossref_works_reads_cache_and_no_cache_refreshes_it(monkeypatch):
+    calls = []
+    monkeypatch.setattr(md, "fetch_json", _one_page_crossref(calls, [{"DOI": "10.1/a"}]))
+    assert md.fetch_crossref_works("2026-09-15", "2026-10-15", md.JOURNALS) == [{"DOI": "10.1/a"}]
+    n = len(calls)
+
+    # second run is served from disk
+    assert md.fetch_crossref_works("2026-09-15", "2026-10-15", md.JOURNALS) == [{"DOI": "10.1/a"}]
+    assert len(calls) == n
+
+    # --no-cache skips the read but the fresh result replaces the entry
+    calls.clear()
+    monkeypatch.setattr(md, "fetch_json", _one_page_crossref(calls, [{"DOI": "10.1/b"}]))
+    assert md.fetch_crossref_works("2026-09-15", "2026-10-15", md.JOURNALS, use_cache=False) == [{"DOI": "10.1/b"}]
+    assert calls
+    calls.clear()
+    assert md.fetch_crossref_works("2026-09-15", "2026-10-15", md.JOURNALS) == [{"DOI": "10.1/b"}]
+    assert not calls
+
+
+def test_crossref_works_does_not_cache_partial_fetch(monkeypatch):
+    monkeypatch.setattr(md, "fetch_json", _one_page_crossref([], [], fail=True))
+    assert md.fetch_crossref_works("2026-09-15", "2026-10-15", md.JOURNALS) == []
+    assert not os.path.exists(md.CROSSREF_CACHE_DIR) or not os.listdir(md.CROSSREF_CACHE_DIR)
+
+
+def _crossref_work(i, day, doi=None, title=None):
+    return {
+        "DOI": doi if doi is not None else f"10.1/w{i}",
+        "title": [title or f"Deep learning for T cell study {i}"],
+        "container-title": ["Nature"],
+        "abstract": "We apply machine learning to tumor immunology.",
+        "URL": f"https://doi.org/10.1/w{i}",
+        "issued": {"date-parts": [[2026, 10, day]]},
+    }
+
+
+def test_fetch_crossref_enriches_whole_capped_sample_and_keeps_top5(monkeypatch):
+    # 60 candidates, newest first: w0 is 2026-10-31 ... w59 is 2026-09-02
+    works = [_crossref_work(i, 0) for i in range(60)]
+    for i, w in enumerate(works):
+        d = dt.date(2026, 10, 31) - dt.timedelta(days=i)
+        w["issued"] = {"date-parts": [[d.year, d.month, d.day]]}
+    monkeypatch.setattr(md, "fetch_crossref_works", lambda *a, **k: works)
+
+    looked_up = []
+
+    def fake_altmetric(doi):
+        looked_up.append(doi)
+        n = int(doi.rsplit("w", 1)[1])
+        return {"altmetric_score": float(n), "tweets": 0}  # older papers score higher
+
+    monkeypatch.setattr(md, "altmetric_by_doi", fake_altmetric)
+    top = md.fetch_crossref(use_cache=False)
+
+    # every other paper across the whole window, no early stop
+    assert sorted(looked_up) == sorted(f"10.1/w{i}" for i in range(0, 60, 2))
+    assert [t["doi"] for t in top] == ["10.1/w58", "10.1/w56", "10.1/w54", "10.1/w52", "10.1/w50"]
+
+
+class _FakeResponse:
+    def __init__(self, retry_after):
+        self.headers = {"Retry-After": retry_after} if retry_after is not None else {}
+
+
+def test_retry_after_is_capped_and_survives_increment():
+    retry = md._ADAPTER.max_retries
+    assert isinstance(retry, md.CappedRetry)
+    assert retry.get_retry_after(_FakeResponse("3600")) == md.RETRY_AFTER_MAX
+    assert retry.get_retry_after(_FakeResponse("2")) == 2
+    assert retry.get_retry_after(_FakeResponse(None)) is None
+    # urllib3 builds the next attempt's Retry via new(); the cap must carry over
+    assert isinstance(retry.new(total=2), md.CappedRetry)
+
+
+def test_long_retry_after_sleeps_at_most_the_cap(monkeypatch):
+    slept = []
+    monkeypatch.setattr(md.time, "sleep", slept.append)
+    assert md._ADAPTER.max_retries.sleep_for_retry(_FakeResponse("3600"))
+    assert slept == [md.RETRY_AFTER_MAX]
+
+
+_ATOM_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <title>ArXiv Query</title>
+  <entry>
+    <id>http://arxiv.org/abs/2410.01234v2</id>
+    <updated>2024-10-05T10:00:00Z</updated>
+    <published>2024-10-02T09:00:00Z</published>
+    <title>Deep learning
+      for   T cell
+      receptors</title>
+    <summary>  We train a
+      transformer.  </summary>
+    <author><name> Ada Lovelace </name></author>
+    <author><name>Alan Turing</name></author>
+    <link href="https://arxiv.org/abs/2410.01234v2" rel="alternate" type="text/html"/>
+    <link href="https://arxiv.org/pdf/2410.01234v2" rel="related" type="application/pdf"/>
+    <arxiv:primary_category term="q-bio.QM" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>
+  <entry>
+    <id>http://arxiv.org/abs/q-bio/0601001v1</id>
+    <updated>2024-10-03T08:00:00Z</updated>
+    <title>No published date</title>
+    <summary>Abstract.</summary>
+  </entry>
+</feed>
+"""
+
+
+def test_parse_arxiv_xml_extracts_fields():
+    first, second = md.parse_arxiv_xml(_ATOM_FEED)
+    assert first == {
+        "source": "arXiv",
+        "arxiv_id": "2410.01234v2",
+        "title": "Deep learning for T cell receptors",
+        "abstract": "We train a transformer.",
+        "authors": ["Ada Lovelace", "Alan Turing"],
+        "published": "2024-10-02",
+        "url": "https://arxiv.org/abs/2410.01234v2",
+        "category": "q-bio.QM",
+    }
+    # old-style ids keep their archive prefix; missing <published> falls back
+    # to <updated>, and without a <link> the id doubles as the URL
+    assert second["arxiv_id"] == "q-bio/0601001v1"
+    assert second["published"] == "2024-10-03"
+    assert second["url"] == "http://arxiv.org/abs/q-bio/0601001v1"
+    assert second["authors"] == [] and second["category"] == ""
+
+
+def test_parse_arxiv_xml_keeps_entries_before_truncation(capsys):
+    cut = _ATOM_FEED.index(b"<entry>", _ATOM_FEED.index(b"</entry>"))
+    recs = list(md.parse_arxiv_xml(_ATOM_FEED[:cut + 40]))
+    assert [r["arxiv_id"] for r in recs] == ["2410.01234v2"]
+    assert "Feed truncated after 1 entries" in capsys.readouterr().out
+
+
+def _check_keyword_matcher(m):
+    assert m.search("a deep learning model of t cell receptors")
+    assert m.search("xxscrnaxx")  # substring, not whole-word, matching
+    assert not m.search("a study of protein folding")
+    assert not m.search("")
+
+
+def test_keyword_matcher_substring_fallback(monkeypatch):
+    monkeypatch.setattr(md, "ahocorasick", None)
+    m = md.KeywordMatcher(["Deep Learning", "scRNA"])
+    assert m.automaton is None
+    _check_keyword_matcher(m)
+
+
+def test_keyword_matcher_automaton():
+    pytest.importorskip("ahocorasick")
+    m = md.KeywordMatcher(["Deep Learning", "scRNA"])
+    assert m.automaton is not None
+    _check_keyword_matcher(m)
+
+
+def test_canonical_doi_strips_resolver_prefixes():
+    for raw in ("10.1/ABC", " https://doi.org/10.1/abc", "http://dx.doi.org/10.1/Abc",
+                "DOI:10.1/abc", "https://DX.DOI.ORG/10.1/abc"):
+        assert md.canonical_doi(raw) == "10.1/abc"
+    assert md.canonical_doi(None) == ""
+    assert md.canonical_doi("") == ""
+
+
+def test_fetch_crossref_dedupes_on_doi_then_title_and_keeps_newest(monkeypatch):
+    works = [
+        _crossref_work(1, 5, doi="10.1/ABC"),
+        _crossref_work(2, 9, doi="https://doi.org/10.1/abc"),
+        _crossref_work(3, 7, doi="doi:10.1/Abc"),
+        # no DOI: same title up to case/whitespace and same journal collapse
+        _crossref_work(4, 3, doi="", title="Deep learning for T cell maps"),
+        _crossref_work(5, 8, doi="", title="deep learning for T cell maps "),
+        # ...but the same title in another journal is a different paper
+        dict(_crossref_work(6, 4, doi="", title="Deep learning for T cell maps"),
+             **{"container-title": ["Cell"]}),
+    ]
+    monkeypatch.setattr(md, "fetch_crossref_works", lambda *a, **k: works)
+    looked_up = []
+    monkeypatch.setattr(md, "altmetric_by_doi",
+                        lambda doi: looked_up.append(doi) or {"altmetric_score": 1.0})
+
+    top = md.fetch_crossref(use_cache=False)
+
+    assert looked_up == ["10.1/abc"]
+    assert sorted((t["url"], t["published"]) for t in top) == [
+        ("https://doi.org/10.1/w2", "2026-10-09"),
+        ("https://doi.org/10.1/w5", "2026-10-08"),
+        ("https://doi.org/10.1/w6", "2026-10-04"),
+    ]
+
+
+_JATS = ("<jats:title>Abstract</jats:title><jats:p>T&amp;cell maps "
+         "<jats:italic>in vivo</jats:italic></jats:p><p>second</p>")
+
+
+def _check_strip_html():
+    assert md.strip_html("plain text, no tags") == "plain text, no tags"
+    assert md.strip_html(_JATS).split() == ["Abstract", "T&cell", "maps", "in", "vivo", "second"]
+
+
+def test_strip_html_regex_fallback(monkeypatch):
+    monkeypatch.setattr(md, "LexborHTMLParser", None)
+    _check_strip_html()
+
+
+def test_strip_html_selectolax():
+    pytest.importorskip("selectolax")
+    assert md.LexborHTMLParser is not None
+    _check_strip_html()